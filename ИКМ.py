@@ -8,11 +8,19 @@
 
 
 class DominoTile:
+    __slots__ = ("value_left", "value_right")
+
+    # Готовые строки всех костей 0..6 × 0..6, индекс — left * 7 + right.
+    _STR = [f"{left}{right}" for left in range(7) for right in range(7)]
+
     def __init__(self, value_left: int, value_right: int) -> None:
         """
+        Значения кости — числа от 0 до 6; на этом основаны таблица _STR,
+        to_str и построение цепочки, сами значения не проверяются.
+
         Args:
-            value_left (int): Левая часть кости.
-            value_right (int): Правая часть кости.
+            value_left (int): Левая часть кости (0..6).
+            value_right (int): Правая часть кости (0..6).
         """
         self.value_left = value_left
         self.value_right = value_right
@@ -33,10 +41,12 @@ class DominoTile:
         Returns:
             str: Строка вида '24' (кость 2|4).
         """
-        return str(self.value_left) + str(self.value_right)
+        return DominoTile._STR[self.value_left * 7 + self.value_right]
 
 
 class DominoNode:
+    __slots__ = ("tile", "prev_node", "next_node")
+
     def __init__(self, tile: DominoTile) -> None:
         """
         Args:
@@ -80,89 +90,205 @@ class DominoLinkedChain:
             current = current.next_node
         return result
 
+    def to_str(self, sep: bytes = b", ") -> str:
+        """
+        Собирает цепочку в одну строку через общий буфер, без
+        промежуточного списка строк.
+
+        Args:
+            sep (bytes): Разделитель между костями.
+
+        Returns:
+            str: Строка вида '02, 24, 40'.
+        """
+        buf = bytearray()
+        current = self.node_first
+        while current:
+            if current is not self.node_first:
+                buf += sep
+            buf.append(0x30 + current.tile.value_left)
+            buf.append(0x30 + current.tile.value_right)
+            current = current.next_node
+        return buf.decode("ascii")
+
     @staticmethod
     def build_if_possible(tiles: list[DominoTile]) -> "DominoLinkedChain | None":
         """
         Пытается построить цепочку из набора костей.
         Возвращает цепочку или None, если построить нельзя.
 
+        Кости рассматриваются как рёбра мультиграфа на вершинах 0..6,
+        цепочка — как эйлеров путь в нём (см. find_euler_path).
+
         Args:
             tiles (list[DominoTile]): Список костей.
 
         Returns:
             DominoLinkedChain | None: Построенная цепочка или None.
         """
-        def generate_permutations(tiles: list[DominoTile]) -> list[list[DominoTile]]:
-            """
-            Генерирует все перестановки костей.
-
-            Args:
-                tiles (list[DominoTile]): Исходные кости.
-
-            Returns:
-                list[list[DominoTile]]: Все перестановки костей.
-            """
-            result: list[list[DominoTile]] = []
+        deg = [0] * 7
+        parent = list(range(7))
+        rank = [0] * 7
+        for tile in tiles:
+            deg[tile.value_left] += 1
+            deg[tile.value_right] += 1
+            dsu_union(parent, rank, tile.value_left, tile.value_right)
+        return DominoLinkedChain.build_checked(tiles, deg, parent)
 
-            def permute(start: int) -> None:
-                if start == len(tiles):
-                    result.append([tile.clone() for tile in tiles])
-                    return
-                for i in range(start, len(tiles)):
-                    tiles[start], tiles[i] = tiles[i], tiles[start]
-                    permute(start + 1)
-                    tiles[start], tiles[i] = tiles[i], tiles[start]
-
-            permute(0)
-            return result
-
-        def generate_flips(tiles: list[DominoTile]) -> list[list[DominoTile]]:
-            """
-            Генерирует все комбинации поворотов костей.
+    @staticmethod
+    def build_checked(
+        tiles: list[DominoTile], deg: list[int], parent: list[int]
+    ) -> "DominoLinkedChain | None":
+        """
+        Строит цепочку по уже собранным степеням вершин и системе
+        множеств (например, накопленным при разборе ввода), не проходя
+        по костям второй раз ради проверки (см. chain_possible).
 
-            Args:
-                tiles (list[DominoTile]): Перестановка костей.
+        Args:
+            tiles (list[DominoTile]): Список костей.
+            deg (list[int]): Степени вершин 0..6 для этих костей.
+            parent (list[int]): Система непересекающихся множеств вершин.
 
-            Returns:
-                list[list[DominoTile]]: Все комбинации с поворотами.
-            """
-            result: list[list[DominoTile]] = []
+        Returns:
+            DominoLinkedChain | None: Построенная цепочка или None.
+        """
+        if not tiles or not chain_possible(deg, parent):
+            return None
+
+        # Поиск ведётся по плоским спискам значений, объекты DominoTile
+        # создаются только для итоговой цепочки: кость i соединяет
+        # соседние вершины пути path[i] и path[i + 1].
+        left = [tile.value_left for tile in tiles]
+        right = [tile.value_right for tile in tiles]
+
+        path = find_euler_path(left, right)
+        chain = DominoLinkedChain()
+        for i in range(len(path) - 1):
+            chain.append_tile(DominoTile(path[i], path[i + 1]))
+        return chain
+
+
+def find_euler_path(left: list[int], right: list[int]) -> list[int]:
+    """
+    Находит эйлеров путь алгоритмом Хиерхольцера за O(V + E).
+    Кость i — ребро между вершинами left[i] и right[i]; граф должен
+    удовлетворять условиям chain_possible.
+
+    Args:
+        left (list[int]): Левые значения костей.
+        right (list[int]): Правые значения костей.
+
+    Returns:
+        list[int]: Вершины пути по порядку (на одну больше, чем костей).
+    """
+    # Смежность в формате CSR: соседи вершины v лежат в
+    # adj_vertex[adj_start[v]:adj_start[v + 1]], номера рёбер — в adj_edge.
+    n = len(left)
+    adj_start = [0] * 8
+    for edge_id in range(n):
+        adj_start[left[edge_id] + 1] += 1
+        adj_start[right[edge_id] + 1] += 1
+    for v in range(7):
+        adj_start[v + 1] += adj_start[v]
+
+    adj_vertex = [0] * (2 * n)
+    adj_edge = [0] * (2 * n)
+    fill = adj_start[:7]
+    for edge_id in range(n):
+        a, b = left[edge_id], right[edge_id]
+        adj_vertex[fill[a]] = b
+        adj_edge[fill[a]] = edge_id
+        fill[a] += 1
+        adj_vertex[fill[b]] = a
+        adj_edge[fill[b]] = edge_id
+        fill[b] += 1
+
+    start = left[0]
+    for v in range(7):
+        if (adj_start[v + 1] - adj_start[v]) % 2 == 1:
+            start = v
+            break
 
-            def flip(index: int) -> None:
-                if index == len(tiles):
-                    result.append([tile.clone() for tile in tiles])
-                    return
-                flip(index + 1)
-                tiles[index].flip()
-                flip(index + 1)
-                tiles[index].flip()
-
-            flip(0)
-            return result
-
-        def is_valid_chain(tiles: list[DominoTile]) -> bool:
-            """
-            Проверяет, образуют ли кости правильную цепочку.
-
-            Args:
-                tiles (list[DominoTile]): Список костей.
-
-            Returns:
-                bool: True, если цепочка допустима.
-            """
-            for i in range(len(tiles) - 1):
-                if tiles[i].value_right != tiles[i + 1].value_left:
-                    return False
-            return True
-
-        for permutation in generate_permutations(tiles):
-            for variant in generate_flips(permutation):
-                if is_valid_chain(variant):
-                    chain = DominoLinkedChain()
-                    for tile in variant:
-                        chain.append_tile(tile)
-                    return chain
-        return None
+    used = bytearray(n)
+    adj_pos = adj_start[:7]
+    stack = [start]
+    path: list[int] = []
+    while stack:
+        vertex = stack[-1]
+        pos = adj_pos[vertex]
+        end = adj_start[vertex + 1]
+        while pos < end and used[adj_edge[pos]]:
+            pos += 1
+        if pos == end:
+            adj_pos[vertex] = pos
+            path.append(stack.pop())
+        else:
+            used[adj_edge[pos]] = 1
+            adj_pos[vertex] = pos + 1
+            stack.append(adj_vertex[pos])
+
+    path.reverse()
+    return path
+
+
+def dsu_find(parent: list[int], v: int) -> int:
+    """
+    Находит корень множества вершины v, попутно сжимая путь.
+
+    Args:
+        parent (list[int]): Система непересекающихся множеств вершин.
+        v (int): Вершина 0..6.
+
+    Returns:
+        int: Корень множества.
+    """
+    while parent[v] != v:
+        parent[v] = parent[parent[v]]
+        v = parent[v]
+    return v
+
+
+def dsu_union(parent: list[int], rank: list[int], a: int, b: int) -> None:
+    """
+    Объединяет множества вершин a и b по рангу.
+
+    Args:
+        parent (list[int]): Система непересекающихся множеств вершин.
+        rank (list[int]): Ранги корней множеств.
+        a (int): Первая вершина 0..6.
+        b (int): Вторая вершина 0..6.
+    """
+    a, b = dsu_find(parent, a), dsu_find(parent, b)
+    if a == b:
+        return
+    if rank[a] < rank[b]:
+        a, b = b, a
+    parent[b] = a
+    if rank[a] == rank[b]:
+        rank[a] += 1
+
+
+def chain_possible(deg: list[int], parent: list[int]) -> bool:
+    """
+    Критерий существования цепочки: вершины с ненулевой степенью лежат
+    в одном множестве, а вершин нечётной степени 0 или 2.
+
+    Args:
+        deg (list[int]): Степени вершин 0..6.
+        parent (list[int]): Система непересекающихся множеств вершин.
+
+    Returns:
+        bool: True, если цепочку составить можно.
+    """
+    roots = {dsu_find(parent, v) for v in range(7) if deg[v] > 0}
+    if len(roots) > 1:
+        return False
+    odd = sum(1 for d in deg if d & 1)
+    return odd in (0, 2)
+
+
+# Значение цифры по ASCII-коду символа, -1 для остальных символов.
+DIGIT_VALUE = [code - 0x30 if 0x30 <= code <= 0x39 else -1 for code in range(128)]
 
 
 def main() -> None:
@@ -197,28 +323,39 @@ def main() -> None:
 
                 parts = [s.strip() for s in input_str.split(",")]
                 tiles: list[DominoTile] = []
+                deg = [0] * 7
+                parent = list(range(7))
+                rank = [0] * 7
                 valid = True
 
                 for part in parts:
-                    if len(part) != 2 or not part.isdigit():
+                    raw = part.encode("ascii", "replace")
+                    if len(raw) != 2:
+                        print("error: input must contain exactly two digits (e.g., 02)")
+                        valid = False
+                        break
+                    a = DIGIT_VALUE[raw[0]]
+                    b = DIGIT_VALUE[raw[1]]
+                    if (a | b) < 0:
                         print("error: input must contain exactly two digits (e.g., 02)")
                         valid = False
                         break
-                    a = int(part[0])
-                    b = int(part[1])
                     if a > 6 or b > 6:
                         print("error: domino values must be between 0 and 6")
                         valid = False
                         break
                     tiles.append(DominoTile(a, b))
+                    deg[a] += 1
+                    deg[b] += 1
+                    dsu_union(parent, rank, a, b)
 
                 if not valid:
                     continue
 
                 all_inputs.append(input_str)
-                chain = DominoLinkedChain.build_if_possible(tiles)
+                chain = DominoLinkedChain.build_checked(tiles, deg, parent)
                 if chain:
-                    print("Можно:", ", ".join(chain.to_list()))
+                    print("Можно:", chain.to_str())
                 else:
                     print("Нельзя.")
                 break